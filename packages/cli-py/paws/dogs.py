@@ -14,16 +14,20 @@ Extracts files from PAWS bundles with support for:
 import sys
 import os
 import argparse
-import base64
+import binascii
 import re
 import difflib
+import functools
 import subprocess
 import json
+import mmap
 import tempfile
 import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Optional, Any, Dict, Tuple
+from typing import List, Optional, Any, Dict, Iterable, Iterator, Tuple
 from enum import Enum
 
 # For interactive mode
@@ -48,13 +52,28 @@ try:
 except ImportError:
     GIT_AVAILABLE = False
 
+# For SIMD Base64 decoding of binary blocks
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
 # --- Configuration Constants ---
 DEFAULT_ENCODING = "utf-8"
 DEFAULT_INPUT_BUNDLE_FILENAME = "dogs.md"
 DEFAULT_OUTPUT_DIR = "."
+BASIC_REVIEW_DIFF_LIMIT = 1000  # Characters of diff shown per file in basic review
+BASIC_REVIEW_PROMPT = "\n[a]ccept / [r]eject / [s]kip / [q]uit: "
+REFERENCE_READ_BUFFER = 1 << 18  # Read buffer for streaming delta reference bundles
+
+# Slotted dataclasses (Python 3.10+) keep per-file records compact
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # --- Bundle Structure Constants ---
 BASE64_HINT_TEXT = "Content:Base64"
+DOGS_MARKER_SYMBOL = "🐕"
+RSI_MARKER_SYMBOL = "⛓"
 DOGS_MARKER_REGEX = re.compile(
     r"^\s*🐕\s*-{3,}\s*DOGS_(START|END)_FILE\s*:\s*(.+?)(\s*\("
     + re.escape(BASE64_HINT_TEXT)
@@ -67,20 +86,64 @@ RSI_MARKER_REGEX = re.compile(
     + r"\))?\s*-{3,}\s*$",
     re.IGNORECASE,
 )
-PAWS_CMD_REGEX = re.compile(r"^\s*@@\s*PAWS_CMD\s+(.+?)\s*@@\s*$")
-MARKDOWN_FENCE_REGEX = re.compile(r"^\s*```[\w-]*\s*$")
+PAWS_CMD_REGEX = re.compile(r"^\s*@@\s*PAWS_CMD\s+(.+?)\s*@@\s*$", re.ASCII)
+MARKDOWN_FENCE_REGEX = re.compile(r"^\s*```[\w-]*\s*$", re.ASCII)
 
 # --- Command Regexes (Full backward compatibility) ---
-REPLACE_LINES_REGEX = re.compile(
-    r"REPLACE_LINES\(\s*(\d+)\s*,\s*(\d+)\s*\)", re.IGNORECASE
+# Commands are ASCII tokens, so ASCII-only \s/\d/\w classes suffice
+# Delta commands share one alternation so a command is parsed in a single match
+DELTA_COMMAND_REGEX = re.compile(
+    r"(?:(DELETE_FILE)\(\s*\)"
+    r"|(REPLACE_LINES|DELETE_LINES)\(\s*(\d+)\s*,\s*(\d+)\s*\)"
+    r"|INSERT_AFTER_LINE\(\s*(\d+)\s*\))",
+    re.IGNORECASE | re.ASCII,
 )
-INSERT_AFTER_LINE_REGEX = re.compile(r"INSERT_AFTER_LINE\(\s*(\d+)\s*\)", re.IGNORECASE)
-DELETE_LINES_REGEX = re.compile(
-    r"DELETE_LINES\(\s*(\d+)\s*,\s*(\d+)\s*\)", re.IGNORECASE
-)
-DELETE_FILE_REGEX = re.compile(r"DELETE_FILE\(\s*\)", re.IGNORECASE)
-REQUEST_CONTEXT_REGEX = re.compile(r"REQUEST_CONTEXT\((.+)\)", re.IGNORECASE)
-EXECUTE_AND_REINVOKE_REGEX = re.compile(r"EXECUTE_AND_REINVOKE\((.+)\)", re.IGNORECASE)
+REQUEST_CONTEXT_REGEX = re.compile(r"REQUEST_CONTEXT\((.+)\)", re.IGNORECASE | re.ASCII)
+EXECUTE_AND_REINVOKE_REGEX = re.compile(r"EXECUTE_AND_REINVOKE\((.+)\)", re.IGNORECASE | re.ASCII)
+CMD_ARGS_REGEX = re.compile(r'(\w+)\s*=\s*"((?:\\"|[^"])*)"', re.ASCII)
+
+# --- Change Statuses ---
+STATUS_PENDING = "pending"
+STATUS_ACCEPTED = "accepted"
+STATUS_REJECTED = "rejected"
+
+# --- Delta Command Types ---
+CMD_REPLACE = "replace"
+CMD_INSERT = "insert"
+CMD_DELETE_LINES = "delete_lines"
+CMD_DELETE_FILE = "delete_file"
+CMD_REQUEST_CONTEXT = "request_context"
+CMD_EXECUTE_AND_REINVOKE = "execute_and_reinvoke"
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_delta_command(cmd_str: str) -> Optional[Tuple]:
+    """Parse a delta PAWS_CMD into an immutable (type, *args) tuple, cached per command string"""
+    m = DELTA_COMMAND_REGEX.match(cmd_str)
+    if m is None:
+        return None
+    if m.group(1):
+        return (CMD_DELETE_FILE,)
+    if m.group(2):
+        cmd_type = CMD_REPLACE if m.group(2).upper() == "REPLACE_LINES" else CMD_DELETE_LINES
+        return (cmd_type, int(m.group(3)), int(m.group(4)))
+    return (CMD_INSERT, int(m.group(5)))
+
+
+@functools.lru_cache(maxsize=None)
+def _allowed_command_patterns() -> Tuple:
+    """Compile the EXECUTE_AND_REINVOKE allowlist on first use"""
+    return tuple(re.compile(pattern) for pattern in (
+        r'^npm (test|run test|run build|run lint)$',
+        r'^yarn (test|build|lint)$',
+        r'^pnpm (test|build|lint)$',
+        r'^make (test|check|build)$',
+        r'^pytest',
+        r'^cargo (test|build|check)$',
+        r'^go test',
+        r'^python -m pytest',
+        r'^\./test\.sh$'
+    ))
 
 
 class FileOperation(Enum):
@@ -89,7 +152,7 @@ class FileOperation(Enum):
     DELETE = "DELETE"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FileChange:
     """Represents a single file change in the bundle"""
     file_path: str
@@ -97,30 +160,43 @@ class FileChange:
     old_content: Optional[str] = None
     new_content: Optional[str] = None
     is_binary: bool = False
-    status: str = "pending"  # pending, accepted, rejected, skipped
+    binary_content: Optional[bytes] = None  # Decoded payload, written as-is
+    status: str = STATUS_PENDING  # pending, accepted, rejected, skipped
     delta_commands: List[Dict] = field(default_factory=list)  # For backward compatibility
     
-    def get_diff(self) -> str:
-        """Generate a unified diff for this change"""
+    def get_diff(self, max_chars: Optional[int] = None) -> str:
+        """Generate a unified diff for this change, stopping once max_chars are collected"""
         if self.operation == FileOperation.DELETE:
             return f"File will be deleted: {self.file_path}"
         elif self.operation == FileOperation.CREATE:
             return f"New file will be created: {self.file_path}"
         elif self.old_content is not None and self.new_content is not None:
+            # Identical content has an empty diff; skip difflib entirely
+            if self.old_content == self.new_content:
+                return ""
             old_lines = self.old_content.splitlines(keepends=True)
             new_lines = self.new_content.splitlines(keepends=True)
-            return "".join(
-                difflib.unified_diff(
-                    old_lines,
-                    new_lines,
-                    fromfile=f"a/{self.file_path}",
-                    tofile=f"b/{self.file_path}",
-                )
+            diff_lines = difflib.unified_diff(
+                old_lines,
+                new_lines,
+                fromfile=f"a/{self.file_path}",
+                tofile=f"b/{self.file_path}",
             )
+            if max_chars is None:
+                return "".join(diff_lines)
+            
+            collected = []
+            total = 0
+            for line in diff_lines:
+                collected.append(line)
+                total += len(line)
+                if total >= max_chars:
+                    break
+            return "".join(collected)
         return ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChangeSet:
     """Collection of all file changes in a bundle"""
     changes: List[FileChange] = field(default_factory=list)
@@ -129,17 +205,19 @@ class ChangeSet:
         self.changes.append(change)
     
     def get_accepted(self) -> List[FileChange]:
-        return [c for c in self.changes if c.status == "accepted"]
+        return [c for c in self.changes if c.status == STATUS_ACCEPTED]
     
     def get_pending(self) -> List[FileChange]:
-        return [c for c in self.changes if c.status == "pending"]
+        return [c for c in self.changes if c.status == STATUS_PENDING]
     
     def summary(self) -> Dict[str, int]:
+        # One pass over the changes; the rich review header calls this on every redraw
+        counts = Counter(c.status for c in self.changes)
         return {
             "total": len(self.changes),
-            "accepted": len([c for c in self.changes if c.status == "accepted"]),
-            "rejected": len([c for c in self.changes if c.status == "rejected"]),
-            "pending": len([c for c in self.changes if c.status == "pending"]),
+            "accepted": counts[STATUS_ACCEPTED],
+            "rejected": counts[STATUS_REJECTED],
+            "pending": counts[STATUS_PENDING],
         }
 
 
@@ -168,23 +246,24 @@ class InteractiveReviewer:
             print(f"Operation: {change.operation.value}")
             
             if change.operation == FileOperation.MODIFY:
-                diff = change.get_diff()
+                # One extra char is enough to know whether to print the marker
+                diff = change.get_diff(max_chars=BASIC_REVIEW_DIFF_LIMIT + 1)
                 if diff:
                     print("\nDiff:")
-                    print(diff[:1000])  # Limit diff output
-                    if len(diff) > 1000:
+                    print(diff[:BASIC_REVIEW_DIFF_LIMIT])  # Limit diff output
+                    if len(diff) > BASIC_REVIEW_DIFF_LIMIT:
                         print("... (diff truncated)")
             
             while True:
-                choice = input("\n[a]ccept / [r]eject / [s]kip / [q]uit: ").lower()
+                choice = input(BASIC_REVIEW_PROMPT).strip().lower()
                 if choice == 'a':
-                    change.status = "accepted"
+                    change.status = STATUS_ACCEPTED
                     break
                 elif choice == 'r':
-                    change.status = "rejected"
+                    change.status = STATUS_REJECTED
                     break
                 elif choice == 's':
-                    change.status = "pending"
+                    change.status = STATUS_PENDING
                     break
                 elif choice == 'q':
                     return self.changeset
@@ -212,13 +291,13 @@ class InteractiveReviewer:
                 )
                 
                 if choice == 'a':  # Accept
-                    change.status = "accepted"
+                    change.status = STATUS_ACCEPTED
                     self.current_index += 1
                 elif choice == 'r':  # Reject
-                    change.status = "rejected"
+                    change.status = STATUS_REJECTED
                     self.current_index += 1
                 elif choice == 's':  # Skip
-                    change.status = "pending"
+                    change.status = STATUS_PENDING
                     self.current_index += 1
                 elif choice == 'p':  # Previous
                     if self.current_index > 0:
@@ -370,6 +449,11 @@ class BundleProcessor:
         self.verify_docs = config.get("verify_docs", False)
         self.apply_delta_from = config.get("apply_delta_from")
         self.original_files = self._load_original_bundle() if self.apply_delta_from else {}
+        # Resolve the output root once; per-file containment checks are then string ops
+        self._output_root = os.path.realpath(config.get("output_dir", "."))
+        self._output_root_prefix = os.path.join(self._output_root, "")
+        # Changes rejected without review are never diffed or written, so current file contents go unused
+        self._read_existing = _auto_review_status(config) != STATUS_REJECTED
     
     def _load_original_bundle(self) -> Dict[str, List[str]]:
         """Load original bundle for delta application"""
@@ -378,17 +462,33 @@ class BundleProcessor:
         
         print(f"Loading delta reference from '{self.apply_delta_from}'...")
         try:
-            with open(self.apply_delta_from, 'r', encoding=DEFAULT_ENCODING) as f:
-                content = f.read()
-            
-            # Parse the original bundle to extract file contents
+            # Take the reference lines straight from the parsed blocks so each
+            # file is decoded once instead of joined and split again
             temp_processor = BundleProcessor({"apply_delta_from": None})
-            temp_changeset = temp_processor.parse_bundle(content)
-            
             original_files = {}
-            for change in temp_changeset.changes:
-                if change.new_content:
-                    original_files[change.file_path] = change.new_content.splitlines()
+            # Stream the file rather than holding the whole text and its split copy at once.
+            # File iteration only breaks on newlines, so each line is split again to keep
+            # str.splitlines() boundaries, the same rule used for on-disk files and bundles
+            with open(self.apply_delta_from, 'r', encoding=DEFAULT_ENCODING,
+                      buffering=REFERENCE_READ_BUFFER) as f:
+                lines = (part for line in f for part in line.splitlines())
+                for file_path, content_lines, is_binary, commands, deletes_file in \
+                        temp_processor._iter_file_blocks(lines):
+                    if commands:
+                        # Delta blocks go through the full file processing, as parse_bundle does
+                        change = temp_processor._process_file(
+                            file_path, content_lines, is_binary, commands, deletes_file
+                        )
+                        if change is not None and change.new_content:
+                            original_files[file_path] = change.new_content.splitlines()
+                        continue
+                    content_lines = self._clean_content(content_lines)
+                    if is_binary and content_lines:
+                        content_lines = self._decode_base64(content_lines).decode(
+                            DEFAULT_ENCODING, errors='ignore'
+                        ).splitlines()
+                    if content_lines:
+                        original_files[file_path] = content_lines
             
             return original_files
         except Exception as e:
@@ -396,86 +496,110 @@ class BundleProcessor:
     
     def parse_bundle(self, bundle_content: str) -> ChangeSet:
         """Parse bundle content into a ChangeSet with FULL backward compatibility"""
-        lines = bundle_content.splitlines()
+        # Every file block starts with a marker symbol; without one there is nothing
+        # to split or scan (e.g. a non-bundle file passed by mistake)
+        marker_symbol = RSI_MARKER_SYMBOL if self.use_rsi_link else DOGS_MARKER_SYMBOL
+        if marker_symbol not in bundle_content:
+            return self.changeset
+        
+        for file_path, content_lines, is_binary, commands, deletes_file in \
+                self._iter_file_blocks(bundle_content.splitlines()):
+            self._process_file(file_path, content_lines, is_binary, commands, deletes_file)
+        
+        return self.changeset
+    
+    def _iter_file_blocks(self, lines: Iterable[str]) -> Iterator[Tuple[str, List[str], bool, List[Dict], bool]]:
+        """Yield (path, content lines, is_binary, commands, deletes_file) for each file block"""
         in_file = False
         current_file = None
         current_content = []
         is_binary = False
         current_commands = []
+        # Tracked while parsing so the END marker needs no scan over the commands
+        deletes_file = False
+        content_cmd = None  # Last command that takes the lines following it
         
         # Choose marker based on RSI-Link mode
-        marker_regex = RSI_MARKER_REGEX if self.use_rsi_link else DOGS_MARKER_REGEX
+        if self.use_rsi_link:
+            marker_regex, marker_symbol = RSI_MARKER_REGEX, RSI_MARKER_SYMBOL
+        else:
+            marker_regex, marker_symbol = DOGS_MARKER_REGEX, DOGS_MARKER_SYMBOL
         
-        for line_num, line in enumerate(lines, 1):
-            match = marker_regex.match(line)
+        for line in lines:
+            # Every marker contains its symbol; a substring test rules out
+            # plain content lines before paying for the regex
+            match = marker_regex.match(line) if marker_symbol in line else None
             
             if match:
                 if match.group(1).upper() == "START":
                     in_file = True
-                    current_file = match.group(2).strip()
+                    # Interned so reference-bundle keys and later lookups share one object
+                    current_file = sys.intern(match.group(2).strip())
                     is_binary = bool(match.group(3))
                     current_content = []
                     current_commands = []
+                    deletes_file = False
+                    content_cmd = None
                 elif match.group(1).upper() == "END" and in_file:
-                    # Process the collected file
-                    self._process_file(current_file, current_content, is_binary, current_commands)
+                    if content_cmd is not None and current_content:
+                        content_cmd["content_lines"] = self._clean_content(current_content)
+                    # Hand the collected file to the caller
+                    yield current_file, current_content, is_binary, current_commands, deletes_file
                     in_file = False
                     current_file = None
             elif in_file:
-                # Check for PAWS_CMD
-                cmd_match = PAWS_CMD_REGEX.match(line)
+                # Check for PAWS_CMD (only lines containing its "@@" delimiter can match)
+                cmd_match = PAWS_CMD_REGEX.match(line) if "@@" in line else None
                 if cmd_match:
                     cmd = self._parse_paws_command(cmd_match.group(1).strip())
                     if cmd:
                         # Handle agentic commands immediately
-                        if cmd["type"] in ["request_context", "execute_and_reinvoke"]:
+                        if cmd["type"] in (CMD_REQUEST_CONTEXT, CMD_EXECUTE_AND_REINVOKE):
                             self._handle_agentic_command(cmd)
                         else:
+                            # Lines collected since the previous command are its content
+                            if content_cmd is not None and current_content:
+                                content_cmd["content_lines"] = self._clean_content(current_content)
+                            current_content = []
                             current_commands.append(cmd)
-                            # Collect content for this command
-                            if current_content and current_commands and \
-                               current_commands[-1].get("type") not in ["delete_lines", "delete_file"]:
-                                current_commands[-1]["content_lines"] = self._clean_content(current_content)
-                                current_content = []
+                            cmd_type = cmd["type"]
+                            if cmd_type == CMD_DELETE_FILE:
+                                deletes_file = True
+                            content_cmd = cmd if cmd_type in (CMD_REPLACE, CMD_INSERT) else None
                 else:
                     current_content.append(line)
-        
-        return self.changeset
     
     def _parse_paws_command(self, cmd_str: str) -> Optional[Dict[str, Any]]:
         """Parse PAWS_CMD for FULL backward compatibility"""
+        # Delta commands first: they are the common case and their parse is cached.
+        # Each call gets a fresh dict, since content_lines is attached later
+        parsed = _parse_delta_command(cmd_str)
+        if parsed is not None:
+            cmd_type = parsed[0]
+            if cmd_type == CMD_DELETE_FILE:
+                return {"type": CMD_DELETE_FILE}
+            if cmd_type == CMD_INSERT:
+                return {"type": CMD_INSERT, "line_num": parsed[1]}
+            return {"type": cmd_type, "start": parsed[1], "end": parsed[2]}
         # REQUEST_CONTEXT command
         if m := REQUEST_CONTEXT_REGEX.match(cmd_str):
             return {
-                "type": "request_context",
+                "type": CMD_REQUEST_CONTEXT,
                 "args": self._parse_cmd_args(m.group(1))
             }
         # EXECUTE_AND_REINVOKE command
         if m := EXECUTE_AND_REINVOKE_REGEX.match(cmd_str):
             return {
-                "type": "execute_and_reinvoke",
+                "type": CMD_EXECUTE_AND_REINVOKE,
                 "args": self._parse_cmd_args(m.group(1))
             }
-        # Delta commands
-        if DELETE_FILE_REGEX.match(cmd_str):
-            return {"type": "delete_file"}
-        if m := REPLACE_LINES_REGEX.match(cmd_str):
-            return {"type": "replace", "start": int(m.group(1)), "end": int(m.group(2))}
-        if m := INSERT_AFTER_LINE_REGEX.match(cmd_str):
-            return {"type": "insert", "line_num": int(m.group(1))}
-        if m := DELETE_LINES_REGEX.match(cmd_str):
-            return {
-                "type": "delete_lines",
-                "start": int(m.group(1)),
-                "end": int(m.group(2))
-            }
         return None
     
     def _parse_cmd_args(self, arg_str: str) -> Dict[str, str]:
         """Parse PAWS_CMD arguments"""
         args = {}
         try:
-            raw_args = re.findall(r'(\w+)\s*=\s*"((?:\\"|[^"])*)"', arg_str)
+            raw_args = CMD_ARGS_REGEX.findall(arg_str)
             for key, value in raw_args:
                 args[key] = value.replace('\\"', '"')
         except Exception:
@@ -484,15 +608,17 @@ class BundleProcessor:
     
     def _handle_agentic_command(self, cmd: Dict[str, Any]):
         """Handle REQUEST_CONTEXT and EXECUTE_AND_REINVOKE commands"""
-        if cmd["type"] == "request_context":
-            print(f"\n--- AI Context Request ---", file=sys.stderr)
-            print("The AI has paused execution and requires more context.", file=sys.stderr)
+        if cmd["type"] == CMD_REQUEST_CONTEXT:
+            # Build the banner first and emit it in one write
+            banner = ["\n--- AI Context Request ---",
+                      "The AI has paused execution and requires more context."]
             if reason := cmd["args"].get("reason"):
-                print(f"\nReason: {reason}", file=sys.stderr)
+                banner.append(f"\nReason: {reason}")
             if suggested := cmd["args"].get("suggested_command"):
-                print(f"\nSuggested command: {suggested}", file=sys.stderr)
+                banner.append(f"\nSuggested command: {suggested}")
+            sys.stderr.write("\n".join(banner) + "\n")
             sys.exit(0)
-        elif cmd["type"] == "execute_and_reinvoke":
+        elif cmd["type"] == CMD_EXECUTE_AND_REINVOKE:
             if not self.allow_reinvoke:
                 print("AI requested command execution, but --allow-reinvoke is not set.", file=sys.stderr)
                 sys.exit(1)
@@ -502,21 +628,8 @@ class BundleProcessor:
                 sys.exit(1)
             
             # Security: Validate command against allowlist
-            allowed_patterns = [
-                r'^npm (test|run test|run build|run lint)$',
-                r'^yarn (test|build|lint)$',
-                r'^pnpm (test|build|lint)$',
-                r'^make (test|check|build)$',
-                r'^pytest',
-                r'^cargo (test|build|check)$',
-                r'^go test',
-                r'^python -m pytest',
-                r'^\./test\.sh$'
-            ]
-            
-            import re
             command_safe = command.strip()
-            if not any(re.match(pattern, command_safe) for pattern in allowed_patterns):
+            if not any(pattern.match(command_safe) for pattern in _allowed_command_patterns()):
                 print(f"\n⚠️  Security: Command not in allowlist: {command}", file=sys.stderr)
                 print("Allowed patterns: npm test, yarn test, pytest, cargo test, etc.", file=sys.stderr)
                 sys.exit(1)
@@ -529,10 +642,21 @@ class BundleProcessor:
                 print("Command finished. Re-invoke the AI with new context.", file=sys.stderr)
             sys.exit(0)
     
-    def _process_file(self, file_path: str, content_lines: List[str], is_binary: bool, commands: List[Dict] = None):
+    def _process_file(self, file_path: str, content_lines: List[str], is_binary: bool, commands: List[Dict] = None,
+                      deletes_file: Optional[bool] = None) -> Optional[FileChange]:
         """Process a single file from the bundle with FULL delta support"""
+        # A path escaping the output directory is reported and left out of the changeset
+        try:
+            abs_path = self._resolve_output_path(file_path)
+        except ValueError:
+            print(f"Warning: Skipping '{file_path}' - path escapes the output directory")
+            return None
+        
+        if deletes_file is None:
+            deletes_file = bool(commands) and any(cmd.get("type") == CMD_DELETE_FILE for cmd in commands)
+        
         # Check for delete command
-        if commands and any(cmd.get("type") == "delete_file" for cmd in commands):
+        if deletes_file:
             change = FileChange(
                 file_path=file_path,
                 operation=FileOperation.DELETE,
@@ -541,20 +665,27 @@ class BundleProcessor:
                 is_binary=is_binary
             )
             self.changeset.add_change(change)
-            return
+            return change
         
         # Clean up content
         content_lines = self._clean_content(content_lines)
         
         # Determine operation
-        abs_path = Path(self.config.get("output_dir", ".")) / file_path
-        
-        if abs_path.exists():
-            operation = FileOperation.MODIFY
-            old_content = abs_path.read_text(encoding=DEFAULT_ENCODING) if not is_binary else None
-        else:
-            operation = FileOperation.CREATE
+        if is_binary or not (self._read_existing or commands):
+            operation = FileOperation.MODIFY if abs_path.exists() else FileOperation.CREATE
             old_content = None
+        else:
+            # Open directly rather than stat first; a missing file means CREATE.
+            # Line endings are kept as-is so the unchanged check compares what is on disk
+            try:
+                with open(abs_path, 'r', encoding=DEFAULT_ENCODING, newline='') as f:
+                    old_content = f.read()
+                operation = FileOperation.MODIFY
+            except (FileNotFoundError, NotADirectoryError):
+                old_content = None
+                operation = FileOperation.CREATE
+        
+        binary_content = None
         
         # Handle delta commands if present
         if commands:
@@ -567,7 +698,12 @@ class BundleProcessor:
                 original_lines = []
             
             if original_lines:
-                new_content = self._apply_delta_commands(original_lines, commands)
+                try:
+                    new_content = self._apply_delta_commands(original_lines, commands)
+                except ValueError as e:
+                    # A malformed delta is left out rather than applied in part
+                    print(f"Warning: Cannot apply delta commands for '{file_path}' - {e}")
+                    return None
             else:
                 # Can't apply deltas without original content
                 print(f"Warning: Cannot apply delta commands for '{file_path}' - no original content")
@@ -575,8 +711,8 @@ class BundleProcessor:
         else:
             # Handle content normally
             if is_binary:
-                content_str = "\n".join(content_lines)
-                new_content = base64.b64decode(content_str).decode(DEFAULT_ENCODING, errors='ignore')
+                binary_content = self._decode_base64(content_lines)
+                new_content = binary_content.decode(DEFAULT_ENCODING, errors='ignore')
             else:
                 new_content = "\n".join(content_lines)
         
@@ -586,90 +722,141 @@ class BundleProcessor:
             old_content=old_content,
             new_content=new_content,
             is_binary=is_binary,
+            binary_content=binary_content,
             delta_commands=commands or []
         )
         
         self.changeset.add_change(change)
+        return change
     
     def _apply_delta_commands(self, original_lines: List[str], commands: List[Dict]) -> str:
         """Apply delta commands to original content - FULL compatibility"""
-        new_lines = list(original_lines)
-        offset = 0
-        
+        # Line numbers refer to the original content, so spans merge in one forward pass
+        spans = []
         for cmd in commands:
             cmd_type = cmd["type"]
-            content = cmd.get("content_lines", [])
-            
-            if cmd_type == "replace":
-                start = cmd["start"] - 1 + offset
-                end = cmd["end"] + offset
-                num_deleted = end - start
-                new_lines[start:end] = content
-                offset += len(content) - num_deleted
-            elif cmd_type == "insert":
-                line_num = cmd["line_num"] + offset
-                new_lines[line_num:line_num] = content
-                offset += len(content)
-            elif cmd_type == "delete_lines":
-                start = cmd["start"] - 1 + offset
-                end = cmd["end"] + offset
-                del new_lines[start:end]
-                offset -= (end - start)
+            if cmd_type == CMD_REPLACE or cmd_type == CMD_DELETE_LINES:
+                start, end = cmd["start"] - 1, cmd["end"]
+            elif cmd_type == CMD_INSERT:
+                start = end = cmd["line_num"]
+            else:
+                continue
+            content = cmd.get("content_lines", []) if cmd_type != CMD_DELETE_LINES else []
+            spans.append((start, end, content))
+        # Stable sort: commands at the same line keep their bundle order
+        spans.sort(key=lambda span: span[0])
+        
+        new_lines = []
+        cursor = 0
+        for start, end, content in spans:
+            if start < cursor:
+                raise ValueError(f"overlapping line ranges at line {start + 1}")
+            new_lines.extend(original_lines[cursor:start])
+            new_lines.extend(content)
+            cursor = max(end, start)
+        new_lines.extend(original_lines[cursor:])
         
         return "\n".join(new_lines)
     
+    @staticmethod
+    def _decode_base64(lines: List[str]) -> bytes:
+        """Decode Base64 content lines in a single call"""
+        # Both decoders skip characters outside the alphabet, so the lines can
+        # be concatenated as-is without the base64 module's wrapper checks
+        encoded = "".join(lines)
+        if PYBASE64_AVAILABLE:
+            try:
+                return pybase64.b64decode(encoded, validate=False)
+            except binascii.Error:
+                pass  # Re-decode below so invalid input reports the stdlib error
+        return binascii.a2b_base64(encoded)
+    
     def _clean_content(self, lines: List[str]) -> List[str]:
         """Remove markdown fences and clean up content"""
         if not lines:
             return []
         
-        # Remove markdown fences
-        if lines and MARKDOWN_FENCE_REGEX.match(lines[0]):
-            lines = lines[1:]
-        if lines and MARKDOWN_FENCE_REGEX.match(lines[-1]):
-            lines = lines[:-1]
+        # Trim by index and slice once at the end, instead of copying the list per removed line
+        start, end = 0, len(lines)
+        
+        # Remove markdown fences (the substring test spares the regex on ordinary edge lines)
+        if "```" in lines[0] and MARKDOWN_FENCE_REGEX.match(lines[0]):
+            start += 1
+        if start < end and "```" in lines[end - 1] and MARKDOWN_FENCE_REGEX.match(lines[end - 1]):
+            end -= 1
         
         # Remove leading/trailing empty lines
-        while lines and not lines[0].strip():
-            lines = lines[1:]
-        while lines and not lines[-1].strip():
-            lines = lines[:-1]
+        while start < end and not lines[start].strip():
+            start += 1
+        while start < end and not lines[end - 1].strip():
+            end -= 1
         
-        return lines
+        return lines[start:end]
     
     def apply_changes(self, changeset: ChangeSet) -> bool:
         """Apply accepted changes to the filesystem"""
         success_count = 0
         error_count = 0
         modified_paths = set()
+        # (change, action or error, pending write) per change, reported in bundle order
+        results = []
+        pending_writes = {}
+        # Parent directories created during this apply, to skip repeated mkdir/stat calls
+        created_dirs = set()
         
-        for change in changeset.get_accepted():
-            try:
-                abs_path = Path(self.config.get("output_dir", ".")) / change.file_path
-                
-                if change.operation == FileOperation.DELETE:
-                    if abs_path.exists():
-                        abs_path.unlink()
-                        print(f"✓ Deleted: {change.file_path}")
-                        success_count += 1
-                else:
-                    # Create parent directories if needed
-                    abs_path.parent.mkdir(parents=True, exist_ok=True)
+        # File writes release the GIL, so they run on a thread pool; deletes,
+        # unchanged checks and directory creation stay on this thread
+        with ThreadPoolExecutor() as executor:
+            for change in changeset.get_accepted():
+                try:
+                    abs_path = self._resolve_output_path(change.file_path)
+                    # A path listed twice must still be handled in bundle order
+                    earlier_write = pending_writes.pop(abs_path, None)
+                    if earlier_write is not None:
+                        wait([earlier_write])
                     
-                    # Write content
-                    if change.is_binary:
-                        abs_path.write_bytes(change.new_content.encode(DEFAULT_ENCODING))
+                    if change.operation == FileOperation.DELETE:
+                        # Unlink directly; a missing file is simply nothing to delete
+                        try:
+                            abs_path.unlink()
+                            results.append((change, "Deleted", None))
+                        except FileNotFoundError:
+                            pass
+                    elif change.operation == FileOperation.MODIFY and change.old_content is not None \
+                            and change.old_content == change.new_content:
+                        # Nothing to write; leave the file (and its mtime) alone
+                        results.append((change, "Unchanged", None))
                     else:
-                        abs_path.write_text(change.new_content, encoding=DEFAULT_ENCODING)
-                    
-                    action = "Created" if change.operation == FileOperation.CREATE else "Modified"
-                    print(f"✓ {action}: {change.file_path}")
-                    success_count += 1
-                    modified_paths.add(change.file_path)
-                    
-            except Exception as e:
-                print(f"✗ Failed to apply {change.file_path}: {e}")
+                        # Create parent directories if needed
+                        parent = abs_path.parent
+                        if parent not in created_dirs:
+                            parent.mkdir(parents=True, exist_ok=True)
+                            created_dirs.add(parent)
+                        
+                        # Write content
+                        data = change.binary_content if change.is_binary else None
+                        if data is None:
+                            data = change.new_content.encode(DEFAULT_ENCODING)
+                        write = executor.submit(self._write_file, abs_path, data)
+                        pending_writes[abs_path] = write
+                        
+                        action = "Created" if change.operation == FileOperation.CREATE else "Modified"
+                        results.append((change, action, write))
+                        
+                except Exception as e:
+                    results.append((change, e, None))
+        
+        for change, outcome, write in results:
+            if write is not None and write.exception() is not None:
+                outcome = write.exception()
+            if isinstance(outcome, Exception):
+                print(f"✗ Failed to apply {change.file_path}: {outcome}")
                 error_count += 1
+            else:
+                print(f"✓ {outcome}: {change.file_path}")
+                success_count += 1
+                if write is not None:
+                    modified_paths.add(change.file_path)
         
         print(f"\nSummary: {success_count} succeeded, {error_count} failed")
         
@@ -679,6 +866,24 @@ class BundleProcessor:
         
         return error_count == 0
     
+    def _resolve_output_path(self, file_path: str) -> Path:
+        """Map a bundle path into the output directory, rejecting escapes"""
+        target = os.path.normpath(os.path.join(self._output_root, file_path))
+        if not target.startswith(self._output_root_prefix):
+            raise ValueError(f"Path escapes output directory: {file_path}")
+        return Path(target)
+    
+    @staticmethod
+    def _write_file(path: Path, data: bytes):
+        """Write the full contents with raw os.write calls"""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
     def _verify_docs_sync(self, modified_paths: set):
         """Verify README.md and CATSCAN.md are in sync"""
         print("\n--- Verifying Documentation Sync ---")
@@ -728,6 +933,26 @@ class BundleProcessor:
             return False
 
 
+def _auto_review_status(config) -> Optional[str]:
+    """Status main() gives every change without review, or None in interactive mode"""
+    if config.get("interactive"):
+        return None
+    if config.get("auto_accept") or not config.get("auto_reject"):
+        return STATUS_ACCEPTED
+    return STATUS_REJECTED
+
+
+def _read_bundle_file(path: str) -> str:
+    """Read a bundle file as text, decoding straight from a memory map"""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return f.read().decode(DEFAULT_ENCODING)
+        with mm:
+            return str(mm, DEFAULT_ENCODING)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="DOGS - Extract and apply files from PAWS bundles with interactive review and verification"
@@ -792,8 +1017,7 @@ def main():
     if args.bundle_file == "-":
         bundle_content = sys.stdin.read()
     else:
-        with open(args.bundle_file, "r", encoding=DEFAULT_ENCODING) as f:
-            bundle_content = f.read()
+        bundle_content = _read_bundle_file(args.bundle_file)
     
     # Process bundle
     processor = BundleProcessor(config)
@@ -803,20 +1027,14 @@ def main():
         print("No changes found in bundle.")
         return 0
     
-    # Review changes
-    if config["interactive"]:
+    # Review changes; without review, -y wins over -n and the default is accept all
+    auto_status = _auto_review_status(config)
+    if auto_status is None:
         reviewer = InteractiveReviewer(changeset)
         changeset = reviewer.review()
-    elif config["auto_accept"]:
-        for change in changeset.changes:
-            change.status = "accepted"
-    elif config["auto_reject"]:
-        for change in changeset.changes:
-            change.status = "rejected"
     else:
-        # Default: accept all
         for change in changeset.changes:
-            change.status = "accepted"
+            change.status = auto_status
     
     # Apply changes
     if config["verify"]:
@@ -10,6 +10,7 @@ import os
 import sys
 import tempfile
 import shutil
+import io
 from pathlib import Path
 from unittest.mock import patch, Mock
 
@@ -79,6 +80,28 @@ class TestAIContextRequests(unittest.TestCase):
 
         self.assertEqual(cm.exception.code, 0)
 
+    def test_request_context_banner_output(self):
+        """Test AI context request banner is written to stderr in full"""
+        bundle = """
+🐕 --- DOGS_START_FILE: test.py ---
+@@ PAWS_CMD request_context(reason="Need test results", suggested_command="npm test") @@
+🐕 --- DOGS_END_FILE: test.py ---
+"""
+
+        processor = dogs.BundleProcessor({"output_dir": str(self.test_dir)})
+
+        with patch('sys.stderr', new_callable=io.StringIO) as err:
+            with self.assertRaises(SystemExit):
+                processor.parse_bundle(bundle)
+
+        self.assertEqual(
+            err.getvalue(),
+            "\n--- AI Context Request ---\n"
+            "The AI has paused execution and requires more context.\n"
+            "\nReason: Need test results\n"
+            "\nSuggested command: npm test\n"
+        )
+
     def test_request_context_minimal(self):
         """Test AI context request with minimal content"""
         bundle = """
@@ -10,6 +10,7 @@ import os
 import sys
 import tempfile
 import shutil
+import io
 from pathlib import Path
 from unittest.mock import patch, Mock, MagicMock
 import subprocess
@@ -167,6 +168,14 @@ print('from stdin')
                 except SystemExit as e:
                     self.assertEqual(e.code, 0)
 
+    def test_read_bundle_file(self):
+        """Test bundle files are read via mmap, including empty files"""
+        self.assertIn("DOGS_START_FILE: test.py", dogs._read_bundle_file(str(self.bundle_file)))
+
+        empty_file = self.test_dir / "empty.md"
+        empty_file.write_text("")
+        self.assertEqual(dogs._read_bundle_file(str(empty_file)), "")
+
 
 class TestRichInteractiveMode(unittest.TestCase):
     """Test Rich interactive mode (lines 198-281)"""
@@ -348,6 +357,27 @@ def hello():
         self.assertEqual(result, 0)
         self.assertFalse((self.test_dir / "test.py").exists())
 
+    def test_main_yes_overrides_no(self):
+        """Test main() with both --yes and --no accepts and skips unchanged files"""
+        target = self.test_dir / "test.py"
+        target.write_text('def hello():\n    print("Hello, World!")')
+        os.utime(target, (0, 0))
+        test_args = [
+            'dogs.py',
+            str(self.bundle_file),
+            str(self.test_dir),
+            '--yes',
+            '--no'
+        ]
+
+        with patch('sys.argv', test_args):
+            with patch('sys.stdout', new_callable=io.StringIO) as out:
+                result = dogs.main()
+
+        self.assertEqual(result, 0)
+        self.assertIn("✓ Unchanged: test.py", out.getvalue())
+        self.assertEqual(target.stat().st_mtime, 0)
+
     def test_main_default_accept(self):
         """Test main() with default accept (lines 818-819)"""
         test_args = [
@@ -53,6 +53,21 @@ class TestFileChange(unittest.TestCase):
         self.assertIn("-old line 1", diff)
         self.assertIn("+new line 1", diff)
 
+    def test_file_change_diff_max_chars(self):
+        """Test a bounded diff is a prefix of the full diff"""
+        change = FileChange(
+            file_path="test.py",
+            operation=FileOperation.MODIFY,
+            old_content="".join(f"old {i}\n" for i in range(500)),
+            new_content="".join(f"new {i}\n" for i in range(500))
+        )
+
+        full_diff = change.get_diff()
+        preview = change.get_diff(max_chars=100)
+        self.assertGreaterEqual(len(preview), 100)
+        self.assertLess(len(preview), len(full_diff))
+        self.assertTrue(full_diff.startswith(preview))
+
     def test_file_change_delete_operation(self):
         """Test delete operation"""
         change = FileChange(
@@ -179,6 +194,30 @@ print('hello world')
         change = changeset.changes[0]
         self.assertTrue(change.is_binary)
 
+    def test_parse_binary_file_wrapped_lines(self):
+        """Test Base64 payload wrapped over several lines decodes as one"""
+        encoded = base64.b64encode(b"wrapped payload " * 8).decode()
+        wrapped = "\n".join(encoded[i:i + 20] for i in range(0, len(encoded), 20))
+        bundle_content = f"""
+🐕 --- DOGS_START_FILE: data.bin (Content:Base64) ---
+{wrapped}
+🐕 --- DOGS_END_FILE: data.bin (Content:Base64) ---
+"""
+        config = {"output_dir": ".", "apply_delta_from": None}
+        processor = BundleProcessor(config)
+        changeset = processor.parse_bundle(bundle_content)
+
+        self.assertEqual(changeset.changes[0].new_content, "wrapped payload " * 8)
+
+    def test_decode_base64_uses_pybase64_when_available(self):
+        """Test the optional pybase64 decoder is preferred when installed"""
+        fake_pybase64 = Mock()
+        fake_pybase64.b64decode.return_value = b"fast"
+        with patch.object(dogs, 'PYBASE64_AVAILABLE', True), \
+                patch.object(dogs, 'pybase64', fake_pybase64, create=True):
+            self.assertEqual(BundleProcessor._decode_base64(["Zm9v", "YmFy"]), b"fast")
+        fake_pybase64.b64decode.assert_called_once_with("Zm9vYmFy", validate=False)
+
     def test_parse_multiple_files(self):
         """Test parsing bundle with multiple files"""
         bundle_content = """
@@ -252,6 +291,16 @@ new line 2
         change = changeset.changes[0]
         self.assertTrue(len(change.delta_commands) > 0)
 
+    def test_parse_repeated_command_gets_fresh_dict(self):
+        """Test identical command strings still yield independent commands"""
+        processor = BundleProcessor({"output_dir": ".", "apply_delta_from": None})
+        first = processor._parse_paws_command("REPLACE_LINES(1, 2)")
+        first["content_lines"] = ["x"]
+        second = processor._parse_paws_command("REPLACE_LINES(1, 2)")
+
+        self.assertEqual(second, {"type": "replace", "start": 1, "end": 2})
+        self.assertIsNot(first, second)
+
     def test_parse_insert_after_line_command(self):
         """Test parsing INSERT_AFTER_LINE command"""
         bundle_content = """
@@ -364,6 +413,159 @@ inserted line
         self.assertIn("inserted", result_lines)
         # line 4 and 5 should be deleted
 
+    def test_apply_delta_commands_out_of_order(self):
+        """Test commands address original line numbers regardless of order"""
+        original_lines = ["line 1", "line 2", "line 3", "line 4", "line 5"]
+
+        config = {"output_dir": ".", "apply_delta_from": None}
+        processor = BundleProcessor(config)
+
+        commands = [
+            {"type": "delete_lines", "start": 4, "end": 5},
+            {"type": "insert", "line_num": 2, "content_lines": ["inserted"]},
+            {"type": "replace", "start": 1, "end": 1, "content_lines": ["a", "b"]},
+        ]
+
+        result = processor._apply_delta_commands(original_lines, commands)
+        self.assertEqual(result.split('\n'), ["a", "b", "line 2", "inserted", "line 3"])
+
+    def test_overlapping_delta_commands_are_rejected(self):
+        """Test overlapping line ranges are reported and the file is left out"""
+        test_dir = Path(tempfile.mkdtemp(prefix="dogs_overlap_"))
+        try:
+            (test_dir / "code.py").write_text("1\n2\n3\n4\n5")
+            bundle_content = """
+🐕 --- DOGS_START_FILE: code.py ---
+@@ PAWS_CMD REPLACE_LINES(1, 3) @@
+A
+@@ PAWS_CMD REPLACE_LINES(2, 4) @@
+B
+🐕 --- DOGS_END_FILE: code.py ---
+"""
+            config = {"output_dir": str(test_dir), "apply_delta_from": None}
+            processor = BundleProcessor(config)
+
+            with self.assertRaises(ValueError):
+                processor._apply_delta_commands(
+                    ["1", "2", "3", "4", "5"],
+                    [{"type": "replace", "start": 1, "end": 3, "content_lines": ["A"]},
+                     {"type": "replace", "start": 2, "end": 4, "content_lines": ["B"]}]
+                )
+
+            with patch('sys.stdout', new_callable=io.StringIO) as out:
+                changeset = processor.parse_bundle(bundle_content)
+
+            self.assertEqual(changeset.changes, [])
+            self.assertIn("Warning: Cannot apply delta commands for 'code.py'", out.getvalue())
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+    def test_parse_delta_content_follows_its_command(self):
+        """Test content after each PAWS_CMD is attached to that command"""
+        test_dir = Path(tempfile.mkdtemp(prefix="dogs_delta_"))
+        try:
+            (test_dir / "code.py").write_text("line 1\nline 2\nline 3\nline 4\n")
+            bundle_content = """
+🐕 --- DOGS_START_FILE: code.py ---
+@@ PAWS_CMD REPLACE_LINES(2, 2) @@
+```
+new line 2
+```
+@@ PAWS_CMD INSERT_AFTER_LINE(3) @@
+```
+inserted
+```
+🐕 --- DOGS_END_FILE: code.py ---
+"""
+            config = {"output_dir": str(test_dir), "apply_delta_from": None}
+            processor = BundleProcessor(config)
+            changeset = processor.parse_bundle(bundle_content)
+
+            commands = changeset.changes[0].delta_commands
+            self.assertEqual(commands[0]["content_lines"], ["new line 2"])
+            self.assertEqual(commands[1]["content_lines"], ["inserted"])
+            self.assertEqual(
+                changeset.changes[0].new_content,
+                "line 1\nnew line 2\nline 3\ninserted\nline 4"
+            )
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+    def test_load_original_bundle_lines(self):
+        """Test reference bundle is loaded as cleaned lines per file"""
+        test_dir = Path(tempfile.mkdtemp(prefix="dogs_ref_"))
+        try:
+            reference = test_dir / "reference.md"
+            reference.write_text("""
+🐕 --- DOGS_START_FILE: base.py ---
+```python
+line 1
+line 2
+```
+🐕 --- DOGS_END_FILE: base.py ---
+""", encoding="utf-8")
+
+            config = {"output_dir": str(test_dir), "apply_delta_from": str(reference)}
+            processor = BundleProcessor(config)
+
+            self.assertEqual(processor.original_files, {"base.py": ["line 1", "line 2"]})
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+    def test_load_original_bundle_keeps_delta_blocks(self):
+        """Test reference blocks holding PAWS_CMD lines still provide their content"""
+        test_dir = Path(tempfile.mkdtemp(prefix="dogs_ref_"))
+        try:
+            reference = test_dir / "reference.md"
+            reference.write_text("""
+🐕 --- DOGS_START_FILE: dogs_ref_missing_base.py ---
+@@ PAWS_CMD REPLACE_LINES(1, 1) @@
+new line 1
+🐕 --- DOGS_END_FILE: dogs_ref_missing_base.py ---
+🐕 --- DOGS_START_FILE: gone.py ---
+@@ PAWS_CMD DELETE_FILE() @@
+🐕 --- DOGS_END_FILE: gone.py ---
+""", encoding="utf-8")
+
+            config = {"output_dir": str(test_dir), "apply_delta_from": str(reference)}
+            with patch('builtins.print'):
+                processor = BundleProcessor(config)
+
+            self.assertEqual(processor.original_files, {"dogs_ref_missing_base.py": ["new line 1"]})
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+    def test_reference_and_disk_bases_split_lines_alike(self):
+        """Test delta line numbers match whether the base comes from -d or from disk"""
+        test_dir = Path(tempfile.mkdtemp(prefix="dogs_ref_"))
+        try:
+            base = "line 1\nx\x0cy\nline 4\x85line 5"
+            reference = test_dir / "reference.md"
+            reference.write_text(
+                f"🐕 --- DOGS_START_FILE: base.py ---\n{base}\n🐕 --- DOGS_END_FILE: base.py ---\n",
+                encoding="utf-8"
+            )
+            bundle_content = """
+🐕 --- DOGS_START_FILE: base.py ---
+@@ PAWS_CMD REPLACE_LINES(4, 4) @@
+replaced
+🐕 --- DOGS_END_FILE: base.py ---
+"""
+            config = {"output_dir": str(test_dir), "apply_delta_from": str(reference)}
+            from_reference = BundleProcessor(config).parse_bundle(bundle_content).changes[0]
+            self.assertEqual(
+                BundleProcessor(config).original_files["base.py"], base.splitlines()
+            )
+
+            (test_dir / "base.py").write_text(base, encoding="utf-8")
+            config["apply_delta_from"] = None
+            from_disk = BundleProcessor(config).parse_bundle(bundle_content).changes[0]
+
+            self.assertEqual(from_reference.new_content, "line 1\nx\ny\nreplaced\nline 5")
+            self.assertEqual(from_disk.new_content, from_reference.new_content)
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
 
 class TestBundleProcessorApplication(unittest.TestCase):
     """Test applying changes to filesystem"""
@@ -400,6 +602,22 @@ class TestBundleProcessorApplication(unittest.TestCase):
         self.assertTrue(created_file.exists())
         self.assertEqual(created_file.read_text(), "print('new file')")
 
+    def test_apply_binary_file_preserves_bytes(self):
+        """Test binary payloads are written byte-for-byte"""
+        payload = bytes(range(256))
+        bundle_content = f"""
+🐕 --- DOGS_START_FILE: blob.bin (Content:Base64) ---
+{base64.b64encode(payload).decode()}
+🐕 --- DOGS_END_FILE: blob.bin (Content:Base64) ---
+"""
+        config = {"output_dir": str(self.test_dir), "apply_delta_from": None}
+        processor = BundleProcessor(config)
+        changeset = processor.parse_bundle(bundle_content)
+        changeset.changes[0].status = "accepted"
+
+        self.assertTrue(processor.apply_changes(changeset))
+        self.assertEqual((self.test_dir / "blob.bin").read_bytes(), payload)
+
     def test_apply_modify_file(self):
         """Test applying MODIFY operation"""
         # Create existing file
@@ -423,6 +641,74 @@ class TestBundleProcessorApplication(unittest.TestCase):
 
         self.assertEqual(test_file.read_text(), "new content")
 
+    def test_apply_unchanged_file_is_not_rewritten(self):
+        """Test MODIFY with identical content skips the write"""
+        test_file = self.test_dir / "same.py"
+        test_file.write_text("same content")
+        os.utime(test_file, (0, 0))
+
+        config = {"output_dir": str(self.test_dir), "apply_delta_from": None}
+        processor = BundleProcessor(config)
+
+        changeset = ChangeSet()
+        change = FileChange(
+            file_path="same.py",
+            operation=FileOperation.MODIFY,
+            old_content="same content",
+            new_content="same content"
+        )
+        change.status = "accepted"
+        changeset.add_change(change)
+
+        self.assertTrue(processor.apply_changes(changeset))
+        self.assertEqual(change.get_diff(), "")
+        self.assertEqual(test_file.stat().st_mtime, 0)
+
+    def test_apply_rewrites_file_differing_only_in_line_endings(self):
+        """Test a CRLF file is rewritten when the bundle content uses LF"""
+        test_file = self.test_dir / "crlf.txt"
+        test_file.write_bytes(b"a\r\nb")
+        bundle_content = """
+🐕 --- DOGS_START_FILE: crlf.txt ---
+a
+b
+🐕 --- DOGS_END_FILE: crlf.txt ---
+"""
+        config = {"output_dir": str(self.test_dir), "apply_delta_from": None}
+        processor = BundleProcessor(config)
+        changeset = processor.parse_bundle(bundle_content)
+        changeset.changes[0].status = "accepted"
+
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            self.assertTrue(processor.apply_changes(changeset))
+
+        self.assertIn("✓ Modified: crlf.txt", out.getvalue())
+        self.assertEqual(test_file.read_bytes(), b"a\nb")
+
+    def test_auto_reject_skips_reading_existing_files(self):
+        """Test -n without review does not load current file contents"""
+        (self.test_dir / "existing.py").write_text("old content")
+        bundle_content = """
+🐕 --- DOGS_START_FILE: existing.py ---
+new content
+🐕 --- DOGS_END_FILE: existing.py ---
+"""
+        config = {"output_dir": str(self.test_dir), "apply_delta_from": None,
+                  "auto_reject": True}
+        change = BundleProcessor(config).parse_bundle(bundle_content).changes[0]
+        self.assertEqual(change.operation, FileOperation.MODIFY)
+        self.assertIsNone(change.old_content)
+
+        config["interactive"] = True
+        change = BundleProcessor(config).parse_bundle(bundle_content).changes[0]
+        self.assertEqual(change.old_content, "old content")
+
+        # -y -n accepts everything, so the current contents are still needed
+        config["interactive"] = False
+        config["auto_accept"] = True
+        change = BundleProcessor(config).parse_bundle(bundle_content).changes[0]
+        self.assertEqual(change.old_content, "old content")
+
     def test_apply_delete_file(self):
         """Test applying DELETE operation"""
         # Create file to delete
@@ -444,6 +730,18 @@ class TestBundleProcessorApplication(unittest.TestCase):
 
         self.assertFalse(test_file.exists())
 
+    def test_apply_delete_missing_file_is_not_an_error(self):
+        """Test DELETE of an absent file is skipped without failing"""
+        config = {"output_dir": str(self.test_dir), "apply_delta_from": None}
+        processor = BundleProcessor(config)
+
+        changeset = ChangeSet()
+        change = FileChange(file_path="never_existed.py", operation=FileOperation.DELETE)
+        change.status = "accepted"
+        changeset.add_change(change)
+
+        self.assertTrue(processor.apply_changes(changeset))
+
     def test_apply_creates_parent_directories(self):
         """Test that applying changes creates parent directories"""
         config = {"output_dir": str(self.test_dir), "apply_delta_from": None}
@@ -463,6 +761,90 @@ class TestBundleProcessorApplication(unittest.TestCase):
         created_file = self.test_dir / "deep" / "nested" / "path" / "file.py"
         self.assertTrue(created_file.exists())
 
+    def test_apply_creates_shared_parent_once(self):
+        """Test files in the same directory trigger a single mkdir"""
+        config = {"output_dir": str(self.test_dir), "apply_delta_from": None}
+        processor = BundleProcessor(config)
+
+        changeset = ChangeSet()
+        for i in range(5):
+            change = FileChange(
+                file_path=f"pkg/file{i}.py",
+                operation=FileOperation.CREATE,
+                new_content=f"content {i}"
+            )
+            change.status = "accepted"
+            changeset.add_change(change)
+
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            self.assertTrue(processor.apply_changes(changeset))
+
+        self.assertEqual(mock_mkdir.call_count, 1)
+        self.assertEqual((self.test_dir / "pkg" / "file4.py").read_text(), "content 4")
+
+    def test_apply_recreates_directory_removed_between_applies(self):
+        """Test a second apply recreates a parent directory removed after the first"""
+        config = {"output_dir": str(self.test_dir), "apply_delta_from": None}
+        processor = BundleProcessor(config)
+
+        changeset = ChangeSet()
+        change = FileChange(file_path="pkg/file.py", operation=FileOperation.CREATE, new_content="content")
+        change.status = "accepted"
+        changeset.add_change(change)
+
+        self.assertTrue(processor.apply_changes(changeset))
+        shutil.rmtree(self.test_dir / "pkg")
+
+        self.assertTrue(processor.apply_changes(changeset))
+        self.assertEqual((self.test_dir / "pkg" / "file.py").read_text(), "content")
+
+    def test_apply_rejects_paths_outside_output_dir(self):
+        """Test bundle paths cannot escape the output directory"""
+        output_dir = self.test_dir / "out"
+        output_dir.mkdir()
+        config = {"output_dir": str(output_dir), "apply_delta_from": None}
+        processor = BundleProcessor(config)
+
+        changeset = ChangeSet()
+        for path in ["../escaped.py", "../out_sibling/file.py", "/tmp/absolute.py"]:
+            change = FileChange(
+                file_path=path,
+                operation=FileOperation.CREATE,
+                new_content="content"
+            )
+            change.status = "accepted"
+            changeset.add_change(change)
+
+        self.assertFalse(processor.apply_changes(changeset))
+        self.assertFalse((self.test_dir / "escaped.py").exists())
+        self.assertFalse((self.test_dir / "out_sibling").exists())
+
+    def test_parse_skips_paths_outside_output_dir(self):
+        """Test bundle paths escaping the output directory are reported and never read"""
+        output_dir = self.test_dir / "out"
+        output_dir.mkdir()
+        (self.test_dir / "secret.txt").write_text("secret\n")
+        bundle_content = """
+🐕 --- DOGS_START_FILE: ../secret.txt ---
+replaced
+🐕 --- DOGS_END_FILE: ../secret.txt ---
+🐕 --- DOGS_START_FILE: ../other.txt ---
+@@ PAWS_CMD DELETE_FILE() @@
+🐕 --- DOGS_END_FILE: ../other.txt ---
+"""
+        config = {"output_dir": str(output_dir), "apply_delta_from": None, "interactive": True}
+        processor = BundleProcessor(config)
+
+        with patch('paws.dogs.open', create=True, side_effect=open) as mock_open, \
+                patch('sys.stdout', new_callable=io.StringIO) as out:
+            changeset = processor.parse_bundle(bundle_content)
+
+        mock_open.assert_not_called()
+        self.assertEqual(changeset.changes, [])
+        self.assertIn("Warning: Skipping '../secret.txt'", out.getvalue())
+        self.assertIn("Warning: Skipping '../other.txt'", out.getvalue())
+        self.assertEqual((self.test_dir / "secret.txt").read_text(), "secret\n")
+
     def test_apply_skips_rejected_changes(self):
         """Test that rejected changes are not applied"""
         config = {"output_dir": str(self.test_dir), "apply_delta_from": None}
@@ -482,6 +864,26 @@ class TestBundleProcessorApplication(unittest.TestCase):
         created_file = self.test_dir / "rejected.py"
         self.assertFalse(created_file.exists())
 
+    def test_apply_many_files_reports_in_order(self):
+        """Test concurrent writes keep bundle order and last-wins duplicates"""
+        config = {"output_dir": str(self.test_dir), "apply_delta_from": None}
+        processor = BundleProcessor(config)
+
+        changeset = ChangeSet()
+        paths = [f"pkg/mod_{i}.py" for i in range(20)] + ["pkg/mod_0.py"]
+        for i, path in enumerate(paths):
+            change = FileChange(file_path=path, operation=FileOperation.CREATE, new_content=f"v{i}")
+            change.status = "accepted"
+            changeset.add_change(change)
+
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            self.assertTrue(processor.apply_changes(changeset))
+
+        reported = [line.split(": ", 1)[1] for line in out.getvalue().splitlines() if line.startswith("✓")]
+        self.assertEqual(reported, paths)
+        self.assertEqual((self.test_dir / "pkg/mod_0.py").read_text(), "v20")
+        self.assertEqual((self.test_dir / "pkg/mod_19.py").read_text(), "v19")
+
 
 class TestInteractiveReviewer(unittest.TestCase):
     """Test interactive review functionality"""
@@ -777,6 +777,15 @@ content
 
         self.assertEqual(cleaned, ["content", "more"])
 
+    def test_processor_clean_content_fence_and_blank_runs(self):
+        """Test _clean_content handles fences wrapping runs of blank lines"""
+        config = {"output_dir": str(self.test_dir)}
+        processor = dogs.BundleProcessor(config)
+
+        self.assertEqual(processor._clean_content(["```", "", "", "code", "  ", "```"]), ["code"])
+        self.assertEqual(processor._clean_content(["```", "```"]), [])
+        self.assertEqual(processor._clean_content(["", " "]), [])
+
     def test_processor_verify_docs_checks_sync(self):
         """Test _verify_docs_sync warns on mismatched docs"""
         config = {"output_dir": str(self.test_dir), "verify_docs": True}